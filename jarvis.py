@@ -4,6 +4,8 @@
 """
 Jarvis desktop assistant – refined:
 - Wake word: "hey jarvis" (enable with --wake)
+  (detected offline by Porcupine when PICOVOICE_ACCESS_KEY is set)
+- Offline streaming speech recognition with Vosk when VOSK_MODEL_PATH is set
 - Sanitized TTS output (no emojis, symbols, code fences, ACTION lines, URLs)
 - Auto-detects OpenRouter vs DeepSeek keys
 - PC control tools (open apps, type, press keys, etc.)
@@ -16,38 +18,75 @@ Usage:
 """
 
 import argparse
+import asyncio
+import dbm
+import hashlib
+import io
 import json
 import os
-import uuid
+import queue
 import re
+import shelve
+import struct
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Tuple
 
-import requests
+import httpx
 from duckduckgo_search import DDGS
-from langdetect import detect
+from langdetect import detect, detector_factory
 from gtts import gTTS
-from playsound import playsound
-import tempfile
 
 
 # Optional voice libs
 try:
     import speech_recognition as sr
-    import pyttsx3
 except Exception:
     sr = None
+
+# Offline TTS; without it Speaker uses gTTS
+try:
+    import pyttsx3
+except Exception:
     pyttsx3 = None
 
+# In-process audio playback (for gTTS clips)
+try:
+    import sounddevice as sd
+    import soundfile as sf
+except Exception:
+    sd = None
+    sf = None
+
+# Offline wake-word engine
+try:
+    import pvporcupine
+except Exception:
+    pvporcupine = None
+
+# Offline streaming speech recognition
+try:
+    from vosk import Model as VoskModel, KaldiRecognizer
+except Exception:
+    VoskModel = None
+    KaldiRecognizer = None
+
 # PC control
 try:
     import pyautogui
 except Exception:
     pyautogui = None
 
+# Fast JSON for LLM request bodies and streamed chunks
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 # .env support
 try:
     from dotenv import load_dotenv
@@ -75,7 +114,37 @@ else:
 
 DESTRUCTIVE_ACTIONS = {"shutdown", "restart", "delete_file"}
 
+# Actions that don't drive the keyboard/mouse/apps, so they may run concurrently
+PARALLEL_SAFE_ACTIONS = {"search_web"}
+
+# system_command output beyond this many characters is cut off (it goes back into the prompt)
+SYSTEM_COMMAND_MAX_OUTPUT = 8192
+
+# Prompt budget: older turns are dropped so per-turn latency doesn't grow with the session
+MAX_PROMPT_TOKENS = int(os.getenv("JARVIS_MAX_PROMPT_TOKENS", "4096"))
+# Tool output goes back to the model as a user message starting with this
+TOOL_RESULT_PREFIX = "Tool result:\n"
+
 WAKE_WORD = "hey jarvis"
+# Also accepted in front of the wake word's last word ("hi jarvis", "ok jarvis", ...)
+WAKE_PREFIXES = ("hey", "hi", "ok", "okay")
+
+# Exact-match reply cache, persisted across sessions
+RESPONSE_CACHE_PATH = os.getenv("JARVIS_CACHE_PATH", os.path.join(os.path.expanduser("~"), ".jarvis_cache"))
+# Oldest replies are evicted past this many entries
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("JARVIS_CACHE_MAX_ENTRIES", "500"))
+# Replies to messages containing these words go stale, so they're never cached
+TIME_SENSITIVE_WORDS = {"now", "today", "tonight", "tomorrow", "yesterday", "time", "date", "latest", "current", "weather", "news"}
+
+# Local Vosk model directory (e.g. vosk-model-small-en-us-0.15); unset = Google STT
+VOSK_MODEL_PATH = os.getenv("VOSK_MODEL_PATH")
+
+# Porcupine spots the wake word locally (built-in "jarvis" keyword, or a custom .ppn file)
+PICOVOICE_ACCESS_KEY = os.getenv("PICOVOICE_ACCESS_KEY")
+PORCUPINE_KEYWORD_PATH = os.getenv("PORCUPINE_KEYWORD_PATH")
+
+# Only these langdetect profiles are loaded (all 55 cost ~40 MB of RAM)
+DETECT_LANGUAGES = ("en", "hi", "es", "fr", "de")
 
 SYSTEM_PROMPT = """You are Jarvis, a helpful desktop AI assistant.
 You can speak any language the user uses (Hindi, English, etc.).
@@ -92,11 +161,18 @@ ACTION search_web {"query":"Latest weather in New Delhi"}
 ACTION screenshot {"path":"./screenshot.png"}
 ACTION read_clipboard {}
 
+To run several independent actions at once, respond with EXACTLY ONE line instead:
+ACTIONS [{"name":"<action_name>","args":<json_args>}, ...]
+
+Example:
+ACTIONS [{"name":"open_app","args":{"name":"notepad"}}, {"name":"search_web","args":{"query":"Latest weather in New Delhi"}}]
+
 Rules:
 1) 'action_name' must be one of: open_app, type_text, press, hotkey, move_mouse, click, scroll, screenshot, search_web, read_clipboard, write_clipboard, system_command.
 2) 'json_args' must be valid JSON, no backticks.
 3) For multiple key presses with modifiers, use 'hotkey'.
 4) Only use actions when you truly need them; otherwise just answer normally.
+5) Actions in an ACTIONS list are run in the order given, except web searches which run in parallel.
 """
 
 # -------------------- UTIL: SANITIZE TTS --------------------
@@ -106,11 +182,64 @@ CODEBLOCK_PATTERN = re.compile(r"```.*?```", flags=re.DOTALL)
 INLINE_CODE_PATTERN = re.compile(r"`([^`]*)`")
 MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\([^)]+\)")
 URL_PATTERN = re.compile(r"https?://\S+")
-ACTION_LINE_PATTERN = re.compile(r"^ACTION\s+[a-zA-Z_]+\s+\{.*\}\s*$", flags=re.DOTALL | re.MULTILINE)
-
+ACTION_PREFIX_PATTERN = re.compile(r"^ACTION(?:\s+[a-zA-Z_]+\s+\{|S\s+\[)")
+
+def bracket_state(text: str, state: Tuple[int, bool, bool] = (0, False, False)) -> Tuple[int, bool, bool]:
+    # (depth, in_string, escaped) after scanning text; brackets inside JSON strings don't count
+    depth, in_str, escaped = state
+    for ch in text:
+        if escaped:
+            escaped = False
+        elif in_str:
+            if ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+    return depth, in_str, escaped
+
+def split_action_blocks(text: str) -> Tuple[List[str], List[str]]:
+    # Line scanner: an ACTION/ACTIONS block runs from its first line until its brackets balance.
+    # A block still open at a blank line or the end of the text is only its first line; the
+    # lines after it go back to the prose. Returns (other lines, blocks); linear, no regex
+    # backtracking across lines.
+    lines: List[str] = []
+    blocks: List[str] = []
+    block: Optional[List[str]] = None
+    state = (0, False, False)
+    for line in text.splitlines():
+        if block is not None and not line.strip():
+            blocks.append(block[0].strip())
+            lines.extend(block[1:])
+            block = None
+        if block is None:
+            if not ACTION_PREFIX_PATTERN.match(line.lstrip()):
+                lines.append(line)
+                continue
+            block, state = [], (0, False, False)
+        block.append(line)
+        state = bracket_state(line, state)
+        if state[0] <= 0:
+            blocks.append("\n".join(block).strip())
+            block = None
+    if block is not None:
+        blocks.append(block[0].strip())
+        lines.extend(block[1:])
+    return lines, blocks
+
+SYMBOL_PATTERN = re.compile(r"[*_#>\[\]{}|~^`]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+@lru_cache(maxsize=512)
 def sanitize_for_tts(text: str) -> str:
-    # Remove ACTION lines altogether
-    text = ACTION_LINE_PATTERN.sub("", text)
+    # Remove ACTION / ACTIONS blocks altogether
+    if "ACTION" in text:
+        text = "\n".join(split_action_blocks(text)[0])
 
     # Remove code blocks and inline code
     text = CODEBLOCK_PATTERN.sub("", text)
@@ -122,48 +251,79 @@ def sanitize_for_tts(text: str) -> str:
     # Remove URLs
     text = URL_PATTERN.sub("", text)
 
-    # Remove emojis and high-plane unicode
-    text = EMOJI_PATTERN.sub("", text)
+    # Remove emojis and high-plane unicode; plain ASCII replies can't contain any
+    if not text.isascii():
+        text = EMOJI_PATTERN.sub("", text)
 
     # Remove a bunch of markdown/bullets/symbols
-    text = re.sub(r"[*_#>\[\]{}|~^`]", " ", text)
+    text = SYMBOL_PATTERN.sub(" ", text)
 
     # Collapse spaces
-    text = re.sub(r"\s+", " ", text).strip()
+    text = WHITESPACE_PATTERN.sub(" ", text).strip()
 
     return text
 
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+
+def split_sentences(text: str) -> List[str]:
+    return [s for s in SENTENCE_SPLIT_PATTERN.split(text) if s.strip()]
+
 # -------------------- DATA STRUCTURES --------------------
 
-@dataclass
-class Message:
-    role: str  # "system" | "user" | "assistant"
-    content: str
+def estimate_tokens(text: str) -> int:
+    # Rough chars/4 estimate; good enough for a budget, no tokenizer needed
+    return len(text) // 4 + 1
 
 @dataclass
 class Conversation:
-    messages: List[Message] = field(default_factory=list)
+    # Stored in the API's own shape ({"role": "system" | "user" | "assistant", "content": ...})
+    # so building a payload needs no per-turn conversion
+    messages: List[Dict[str, str]] = field(default_factory=list)
 
     def add(self, role: str, content: str):
-        self.messages.append(Message(role=role, content=content))
+        self.messages.append({"role": role, "content": content})
+
+    def trim(self, max_tokens: int = MAX_PROMPT_TOKENS):
+        # Keep system prompt(s) + the newest turns that fit; the latest message is always kept
+        system = [m for m in self.messages if m["role"] == "system"]
+        rest = [m for m in self.messages if m["role"] != "system"]
+        budget = max_tokens - sum(estimate_tokens(m["content"]) for m in system)
+
+        start, used = len(rest), 0
+        while start > 0:
+            cost = estimate_tokens(rest[start - 1]["content"])
+            if used + cost > budget and start < len(rest):
+                break
+            used += cost
+            start -= 1
+
+        # The window should open on a real user turn; a tool result belongs to the exchange
+        # before it, so skip ahead to the next user turn, or back to the latest one if none
+        def opens_exchange(m: Dict[str, str]) -> bool:
+            return m["role"] == "user" and not m["content"].startswith(TOOL_RESULT_PREFIX)
+
+        while start < len(rest) and not opens_exchange(rest[start]):
+            start += 1
+        if start == len(rest):
+            start = len(rest) - 1
+            while start > 0 and not opens_exchange(rest[start]):
+                start -= 1
+
+        if start:
+            self.messages = system + rest[start:]
 
     def as_openai_payload(self, model: str) -> Dict[str, Any]:
+        self.trim()
         return {
             "model": model,
-            "messages": [{"role": m.role, "content": m.content} for m in self.messages],
-            "stream": False,
+            "messages": self.messages,
+            "stream": True,
             "temperature": 0.7,
         }
 
 # -------------------- LLM CALL --------------------
 
-def call_llm(conv: Conversation) -> str:
-    if not API_KEY:
-        raise RuntimeError("No API key found. Set DEEPSEEK_API_KEY (native) or OPENROUTER_API_KEY / DEEPSEEK_API_KEY (sk-or- prefix).")
-
-    url = f"{API_BASE}/chat/completions"
-    payload = conv.as_openai_payload(MODEL)
-
+def _llm_headers() -> Dict[str, str]:
     headers = {
         "Authorization": f"Bearer {API_KEY}",
         "Content-Type": "application/json",
@@ -173,24 +333,144 @@ def call_llm(conv: Conversation) -> str:
     if IS_OPENROUTER:
         headers["HTTP-Referer"] = "http://localhost"
         headers["X-Title"] = "Jarvis Desktop Assistant"
+    return headers
 
-    resp = requests.post(url, headers=headers, json=payload, timeout=120)
-    if resp.status_code == 401:
-        raise RuntimeError(f"401 Unauthorized. Check if your key matches the endpoint. (OpenRouter key => use openrouter.ai)")
-    resp.raise_for_status()
-    data = resp.json()
+# One pooled HTTP/2 client for the whole session (keep-alive, no per-call TLS handshake)
+HTTP_CLIENT = httpx.AsyncClient(http2=True, timeout=120, headers=_llm_headers())
 
-    try:
-        return data["choices"][0]["message"]["content"]
-    except Exception as e:
-        raise RuntimeError(f"Unexpected LLM response: {data}") from e
+# -------------------- RESPONSE CACHE --------------------
+
+try:
+    # Owner-only: the cache holds past replies in plain text
+    RESPONSE_CACHE = shelve.Shelf(dbm.open(RESPONSE_CACHE_PATH, "c", 0o600))
+except Exception as e:
+    print(f"[Cache error] {e}; using an in-memory cache")
+    RESPONSE_CACHE = {}
+
+def _cache_stamp(key: str) -> float:
+    # Entries are (stored_at, text); anything else predates eviction and goes first
+    entry = RESPONSE_CACHE.get(key)
+    return entry[0] if isinstance(entry, tuple) else 0.0
+
+# Cache keys oldest first, read once so eviction doesn't rescan the shelf
+CACHE_ORDER: Dict[str, None] = dict.fromkeys(sorted(RESPONSE_CACHE.keys(), key=_cache_stamp))
+
+def cache_get(key: str) -> Optional[str]:
+    entry = RESPONSE_CACHE.get(key)
+    return entry[1] if isinstance(entry, tuple) else None
+
+def cache_put(key: str, text: str):
+    RESPONSE_CACHE[key] = (time.time(), text)
+    CACHE_ORDER.pop(key, None)
+    CACHE_ORDER[key] = None
+    while len(CACHE_ORDER) > RESPONSE_CACHE_MAX_ENTRIES:
+        oldest = next(iter(CACHE_ORDER))
+        del CACHE_ORDER[oldest]
+        RESPONSE_CACHE.pop(oldest, None)
+
+def response_cache_key(conv: Conversation) -> Optional[str]:
+    # Key on model + system prompt + the exchange being answered; None = don't cache
+    last = conv.messages[-1] if conv.messages else None
+    if last is None or last["role"] != "user":
+        return None
+    if TIME_SENSITIVE_WORDS.intersection(re.findall(r"\w+", last["content"].lower())):
+        return None
+
+    system = "".join(m["content"] for m in conv.messages if m["role"] == "system")
+    # The previous assistant turn keeps short replies like "yes" from colliding
+    prev = conv.messages[-2]["content"] if len(conv.messages) > 1 and conv.messages[-2]["role"] == "assistant" else ""
+    raw = "\0".join((MODEL, system, prev, last["content"]))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+def json_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode("utf-8")
+
+json_loads = orjson.loads if orjson else json.loads
+
+async def call_llm(conv: Conversation, on_delta: Optional[Callable[[str], None]] = None) -> str:
+    if not API_KEY:
+        raise RuntimeError("No API key found. Set DEEPSEEK_API_KEY (native) or OPENROUTER_API_KEY / DEEPSEEK_API_KEY (sk-or- prefix).")
+
+    key = response_cache_key(conv)
+    cached = cache_get(key) if key else None
+    if cached is not None:
+        if on_delta:
+            on_delta(cached)
+        return cached
+
+    text, complete = await _stream_llm(conv, on_delta)
+    # A stream that dropped mid-reply must not be replayed on later turns
+    if key and complete and text.strip():
+        cache_put(key, text)
+    return text
+
+async def _stream_llm(conv: Conversation, on_delta: Optional[Callable[[str], None]] = None) -> Tuple[str, bool]:
+    # Returns (text, complete): complete = reached [DONE] or stopped after a whole ACTION block
+    url = f"{API_BASE}/chat/completions"
+    payload = conv.as_openai_payload(MODEL)
+
+    lines: List[str] = []
+    partial = ""
+    action_state = None  # bracket state while inside an ACTION/ACTIONS block
+    # Content-Type: application/json is already a client default header
+    async with HTTP_CLIENT.stream("POST", url, content=json_dumps(payload)) as resp:
+        if resp.status_code == 401:
+            raise RuntimeError(f"401 Unauthorized. Check if your key matches the endpoint. (OpenRouter key => use openrouter.ai)")
+        if resp.is_error:
+            await resp.aread()
+        resp.raise_for_status()
+
+        async for raw in resp.aiter_lines():
+            # SSE: skip keep-alive blanks and ": comment" lines
+            if not raw.startswith("data:"):
+                continue
+            data = raw[len("data:"):].strip()
+            if data == "[DONE]":
+                lines.append(partial)
+                return "\n".join(lines), True
+            try:
+                chunk = json_loads(data)
+            except json.JSONDecodeError as e:
+                raise RuntimeError(f"Unexpected LLM response: {data}") from e
+            if "error" in chunk:
+                raise RuntimeError(f"Unexpected LLM response: {chunk}")
+
+            choices = chunk.get("choices") or [{}]
+            delta = (choices[0].get("delta") or {}).get("content") or ""
+            if on_delta and delta:
+                on_delta(delta)
+            partial += delta
+
+            *done, partial = partial.split("\n")
+            for line in done:
+                lines.append(line)
+                if action_state is not None and not line.strip():
+                    action_state = None  # never closed; split_action_blocks keeps its first line only
+                if action_state is None and ACTION_PREFIX_PATTERN.match(line.lstrip()):
+                    action_state = (0, False, False)
+                if action_state is None:
+                    continue
+                action_state = bracket_state(line, action_state)
+                if action_state[0] <= 0:
+                    # Tool call is complete: drop the rest of the stream and act on it now
+                    return "\n".join(lines), True
+
+    lines.append(partial)
+    return "\n".join(lines), False
 
 # -------------------- ACTION PARSER --------------------
 
+# Applied to one block from split_action_blocks, so DOTALL can't run across the reply
 ACTION_REGEX = re.compile(r'^ACTION\s+([a-zA-Z_]+)\s+(\{.*\})\s*$', re.DOTALL)
+ACTIONS_REGEX = re.compile(r'^ACTIONS\s+(\[.*\])\s*$', re.DOTALL)
+
+def first_action_block(text: str) -> str:
+    blocks = split_action_blocks(text)[1]
+    return blocks[0] if blocks else ""
 
 def try_parse_action(text: str):
-    m = ACTION_REGEX.match(text.strip())
+    # The ACTION may follow a short preamble and its JSON may span several lines
+    m = ACTION_REGEX.match(first_action_block(text))
     if not m:
         return None, None
     name = m.group(1).strip()
@@ -200,12 +480,47 @@ def try_parse_action(text: str):
         return None, None
     return name, args
 
+def try_parse_actions(text: str) -> List[Tuple[str, Dict[str, Any]]]:
+    # ACTIONS [...] list first, then a single ACTION line; [] if neither parses
+    m = ACTIONS_REGEX.match(first_action_block(text))
+    if m:
+        try:
+            items = json.loads(m.group(1))
+            actions = [(str(item["name"]), item.get("args") or {}) for item in items]
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            return []
+        return [(name, args) for name, args in actions if isinstance(args, dict)]
+    name, args = try_parse_action(text)
+    return [(name, args)] if name else []
+
 # -------------------- TOOLS --------------------
 
+# One DuckDuckGo session for the whole run, reused across searches (keeps cookies and
+# connections warm). Parallel searches share it; DDGS already fans its own page requests
+# out over threads on the same client. In duckduckgo-search 6.1.7 a failed request sets
+# DDGS._exception_event for good, and every later call on that instance fails with
+# "Exception occurred in previous call.", so a failed session is swapped for a new one.
+_ddgs_client: Optional[DDGS] = None
+_ddgs_lock = threading.Lock()
+
+def _ddgs() -> DDGS:
+    global _ddgs_client
+    with _ddgs_lock:
+        if _ddgs_client is None:
+            _ddgs_client = DDGS()
+        return _ddgs_client
+
+def _drop_ddgs(client: DDGS):
+    global _ddgs_client
+    with _ddgs_lock:
+        # A parallel search may already have replaced it
+        if _ddgs_client is client:
+            _ddgs_client = None
+
 def tool_search_web(query: str, max_results: int = 5) -> str:
+    client = _ddgs()
     try:
-        with DDGS() as ddgs:
-            results = ddgs.text(query, max_results=max_results)
+        results = client.text(query, max_results=max_results)
         out = []
         for i, r in enumerate(results, 1):
             title = r.get("title", "")
@@ -214,6 +529,8 @@ def tool_search_web(query: str, max_results: int = 5) -> str:
             out.append(f"{i}. {title}\n{body}\n{link}\n")
         return "\n".join(out) if out else "No results."
     except Exception as e:
+        # The failed session is unusable now; the next search starts a fresh one
+        _drop_ddgs(client)
         return f"Search failed: {e}"
 
 def tool_open_app(name: str):
@@ -296,55 +613,271 @@ def tool_write_clipboard(text: str):
 
 def tool_system_command(cmd: str):
     try:
-        out = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT, text=True)
+        # Read at most one character past the cap instead of buffering all of the output;
+        # read(n) returns early only at EOF, so newline-free output is capped too
+        with subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True) as p:
+            out = p.stdout.read(SYSTEM_COMMAND_MAX_OUTPUT + 1)
+            truncated = len(out) > SYSTEM_COMMAND_MAX_OUTPUT
+            if truncated:
+                p.terminate()
+        if truncated:
+            return f"{out[:SYSTEM_COMMAND_MAX_OUTPUT]}\n[Output truncated after {SYSTEM_COMMAND_MAX_OUTPUT} characters]"
+        if p.returncode:
+            return f"Command failed with code {p.returncode}:\n{out}"
         return out
-    except subprocess.CalledProcessError as e:
-        return f"Command failed with code {e.returncode}:\n{e.output}"
     except Exception as e:
         return f"Command failed: {e}"
 
+# action name -> (tool, adapter mapping the JSON args to the tool's positional args)
 TOOLBOX = {
-    "search_web": tool_search_web,
-    "open_app": tool_open_app,
-    "type_text": tool_type_text,
-    "press": tool_press,
-    "hotkey": tool_hotkey,
-    "move_mouse": tool_move_mouse,
-    "click": tool_click,
-    "scroll": tool_scroll,
-    "screenshot": tool_screenshot,
-    "read_clipboard": tool_read_clipboard,
-    "write_clipboard": tool_write_clipboard,
-    "system_command": tool_system_command,
+    "search_web": (tool_search_web, lambda a: (a.get("query", ""), int(a.get("max_results", 5)))),
+    "open_app": (tool_open_app, lambda a: (a.get("name", ""),)),
+    "type_text": (tool_type_text, lambda a: (a.get("text", ""),)),
+    "press": (tool_press, lambda a: (a.get("keys", []),)),
+    "hotkey": (tool_hotkey, lambda a: (a.get("keys", []),)),
+    "move_mouse": (tool_move_mouse, lambda a: (int(a.get("x", 0)), int(a.get("y", 0)), float(a.get("duration", 0.2)))),
+    "click": (tool_click, lambda a: (a.get("button", "left"), int(a.get("clicks", 1)))),
+    "scroll": (tool_scroll, lambda a: (int(a.get("amount", 0)),)),
+    "screenshot": (tool_screenshot, lambda a: (a.get("path", "./screenshot.png"),)),
+    "read_clipboard": (tool_read_clipboard, lambda a: ()),
+    "write_clipboard": (tool_write_clipboard, lambda a: (a.get("text", ""),)),
+    "system_command": (tool_system_command, lambda a: (a.get("cmd", ""),)),
 }
 
 # -------------------- VOICE --------------------
 
 class Speaker:
+    """Offline TTS via a long-lived pyttsx3 engine.
+
+    Falls back to gTTS if pyttsx3 is missing or can't start; then sentence N+1 is
+    synthesized while sentence N is playing."""
+
+    def __init__(self):
+        self._texts: "queue.Queue[str]" = queue.Queue()
+        self._clips: "queue.Queue[Tuple[Any, int]]" = queue.Queue()
+        self.engine = None
+
+        if pyttsx3:
+            # The engine must live on the thread that drives it
+            ready = threading.Event()
+            threading.Thread(target=self._engine_loop, args=(ready,), daemon=True).start()
+            ready.wait()
+
+        if self.engine is None:
+            if sd is None:
+                print("[TTS error] gTTS playback needs: pip install sounddevice soundfile")
+            threading.Thread(target=self._synth_loop, daemon=True).start()
+            threading.Thread(target=self._play_loop, daemon=True).start()
+
     def say(self, text: str):
-        clean = sanitize_for_tts(text)
-        if not clean:
-            return
+        # Queue only; returns immediately. Use wait() to block until spoken.
+        for sentence in split_sentences(sanitize_for_tts(text)):
+            self._texts.put(sentence)
+
+    def wait(self):
+        self._texts.join()
+        self._clips.join()
+        if sd and self.engine is None:
+            sd.wait()
 
-        tmp_path = os.path.join(tempfile.gettempdir(), f"jarvis_{uuid.uuid4().hex}.mp3")
+    def _engine_loop(self, ready: threading.Event):
         try:
-            tts = gTTS(text=clean, lang="en")
-            tts.save(tmp_path)
-            playsound(tmp_path)
+            self.engine = pyttsx3.init()
         except Exception as e:
-            print(f"[TTS error] {e}")
+            print(f"[TTS error] pyttsx3 unavailable, using gTTS: {e}")
+            return
         finally:
+            ready.set()
+
+        while True:
+            text = self._texts.get()
+            try:
+                self.engine.say(text)
+                self.engine.runAndWait()
+            except Exception as e:
+                print(f"[TTS error] {e}")
+            finally:
+                self._texts.task_done()
+
+    def _synth_loop(self):
+        while True:
+            text = self._texts.get()
             try:
-                os.remove(tmp_path)
-            except Exception:
-                pass
+                # mp3 stays in memory and is decoded here, while the previous clip plays
+                buf = io.BytesIO()
+                gTTS(text=text, lang="en").write_to_fp(buf)
+                buf.seek(0)
+                self._clips.put(sf.read(buf))
+            except Exception as e:
+                print(f"[TTS error] {e}")
+            finally:
+                self._texts.task_done()
+
+    def _play_loop(self):
+        while True:
+            data, rate = self._clips.get()
+            try:
+                sd.wait()
+                sd.play(data, rate)
+            except Exception as e:
+                print(f"[TTS error] {e}")
+            finally:
+                self._clips.task_done()
+
+
+class SpeechStream:
+    """Feeds streamed LLM deltas to a Speaker one sentence at a time."""
+
+    def __init__(self, speaker: Speaker):
+        self.speaker = speaker
+        self.line = ""       # current, not yet terminated line
+        self.fed = 0         # chars of self.line already moved to self.pending
+        self.pending = ""    # text waiting for a sentence boundary
+        self.in_code = False
+        self.action_state = None  # bracket state while inside an ACTION/ACTIONS block
+        self.action_rest: List[str] = []  # lines after the block's first, spoken if it never closes
+
+    def feed(self, delta: str):
+        *done, self.line = (self.line + delta).split("\n")
+        for line in done:
+            self._consume(line, final=True)
+            self.fed = 0
+        self._consume(self.line, final=False)
+
+    def flush(self):
+        # The reply is over, so a held-back last line is now complete
+        self._consume(self.line, final=True)
+        self.line, self.fed = "", 0
+        if self.action_state is not None:
+            self._release_action()
+        if self.pending.strip():
+            self.speaker.say(self.pending)
+        self.pending = ""
+
+    def _consume(self, line: str, final: bool):
+        head = line.lstrip()
+        if self.action_state is not None:
+            # Inside an ACTION / ACTIONS payload: silent until its brackets balance
+            if not final:
+                return
+            if line.strip():
+                self.action_rest.append(line)
+                self._track_action(line)
+                return
+            self._release_action()
+        if head.startswith("```"):
+            if final:
+                self.in_code = not self.in_code
+            return
+        if self.in_code:
+            return
+        # Hold back anything that may still turn out to be an ACTION line or code fence
+        if not final and any(p.startswith(head[:len(p)]) for p in ("ACTION", "```")):
+            return
+        if final and ACTION_PREFIX_PATTERN.match(head):
+            self.action_state = (0, False, False)
+            self._track_action(line)
+            return
+
+        self.pending += line[self.fed:] + ("\n" if final else "")
+        self.fed = len(line)
+        *sentences, self.pending = SENTENCE_SPLIT_PATTERN.split(self.pending)
+        for sentence in sentences:
+            if sentence.strip():
+                self.speaker.say(sentence)
+
+    def _track_action(self, line: str):
+        # Same block rule as split_action_blocks
+        self.action_state = bracket_state(line, self.action_state)
+        if self.action_state[0] <= 0:
+            self.action_state = None
+            self.action_rest = []
+
+    def _release_action(self):
+        # Block never closed: only its first line was the action, the rest is prose
+        rest, self.action_state, self.action_rest = self.action_rest, None, []
+        for line in rest:
+            self._consume(line, final=True)
 
 
 class Listener:
-    def __init__(self, language_hint: Optional[str] = None):
+    def __init__(self, language_hint: Optional[str] = None, wake_engine: bool = False, wake_word: str = WAKE_WORD):
         self.language_hint = language_hint
         self.r = sr.Recognizer() if sr else None
-        self.mic = sr.Microphone() if (sr and Listener.mic_available()) else None
+        mic_ok = Listener.mic_available()
+        # Porcupine reads the mic stream itself, so it's only useful with a working mic
+        self.wake_keyword = Listener.porcupine_keyword(wake_word) if (wake_engine and mic_ok) else None
+        self.porcupine = Listener.create_porcupine(self.wake_keyword) if self.wake_keyword else None
+        vosk_model = Listener.load_vosk_model()
+
+        # Porcupine and Vosk want 16 kHz audio (Porcupine also in frames of its own size)
+        mic_kwargs = {}
+        if self.porcupine:
+            mic_kwargs = {"sample_rate": self.porcupine.sample_rate, "chunk_size": self.porcupine.frame_length}
+        elif vosk_model:
+            mic_kwargs = {"sample_rate": 16000}
+        # close() sets _stop and waits on _reading, so the mic isn't torn down mid-read
+        self._stop = threading.Event()
+        self._reading = threading.Lock()
+        self.mic = sr.Microphone(**mic_kwargs) if mic_ok else None
+        self.source = None
+        self.vosk = KaldiRecognizer(vosk_model, self.mic.SAMPLE_RATE) if (vosk_model and self.mic) else None
+
+        if self.r and self.mic:
+            # Open the mic and calibrate once for the whole session, not every turn
+            self.source = self.mic.__enter__()
+            self.r.adjust_for_ambient_noise(self.source, duration=1.0)
+            self.r.dynamic_energy_threshold = False
+
+    def close(self):
+        self._stop.set()
+        # Reads poll _stop between chunks; if one is still stuck, leave the stream alone
+        if not self._reading.acquire(timeout=2):
+            return
+        try:
+            if self.source is not None:
+                self.mic.__exit__(None, None, None)
+                self.source = None
+            if self.porcupine is not None:
+                self.porcupine.delete()
+                self.porcupine = None
+        finally:
+            self._reading.release()
+
+    @staticmethod
+    def porcupine_keyword(wake_word: str) -> Optional[str]:
+        # Built-in keyword matching the wake word ("hey jarvis" -> "jarvis"); None = use the STT check
+        if pvporcupine is None or not PICOVOICE_ACCESS_KEY:
+            return None
+        if PORCUPINE_KEYWORD_PATH:
+            return wake_word  # custom .ppn file, trained for this wake word
+        ww = wake_word.strip().lower() or WAKE_WORD
+        for keyword in (ww, ww.split()[-1]):
+            if keyword in pvporcupine.KEYWORDS:
+                return keyword
+        print(f"[Wake word] No built-in Porcupine keyword for '{wake_word}'; using speech recognition instead")
+        return None
+
+    @staticmethod
+    def create_porcupine(keyword: str):
+        try:
+            if PORCUPINE_KEYWORD_PATH:
+                return pvporcupine.create(access_key=PICOVOICE_ACCESS_KEY, keyword_paths=[PORCUPINE_KEYWORD_PATH])
+            return pvporcupine.create(access_key=PICOVOICE_ACCESS_KEY, keywords=[keyword])
+        except Exception as e:
+            print(f"[Wake word error] {e}")
+            return None
+
+    @staticmethod
+    def load_vosk_model():
+        if VoskModel is None or not VOSK_MODEL_PATH:
+            return None
+        try:
+            return VoskModel(VOSK_MODEL_PATH)
+        except Exception as e:
+            print(f"[STT error] Can't load Vosk model, using Google STT: {e}")
+            return None
 
     @staticmethod
     def mic_available() -> bool:
@@ -356,21 +889,80 @@ class Listener:
         except Exception:
             return False
 
+    def wait_for_wake_word(self) -> bool:
+        # Runs fully offline: raw mic frames -> Porcupine, no network until the keyword fires
+        with self._reading:
+            frame_length = self.porcupine.frame_length
+            fmt = f"{frame_length}h"
+            while not self._stop.is_set():
+                pcm = struct.unpack_from(fmt, self.source.stream.read(frame_length))
+                if self.porcupine.process(pcm) >= 0:
+                    return True
+            return False
+
     def listen_once(self) -> Optional[str]:
-        if not self.r or not self.mic:
+        if self.source is None:
+            return None
+        print("Listening...")
+        if self.vosk:
+            return self.listen_vosk()
+        with self._reading:
+            audio = None
+            while audio is None and not self._stop.is_set():
+                try:
+                    # Short timeout so a pending close() isn't kept waiting by silence
+                    audio = self.r.listen(self.source, timeout=1)
+                except sr.WaitTimeoutError:
+                    continue
+        if audio is None:
             return None
-        with self.mic as source:
-            print("Listening...")
-            self.r.adjust_for_ambient_noise(source, duration=0.3)
-            audio = self.r.listen(source)
         try:
             return self.r.recognize_google(audio, language=self.language_hint or "en-IN")
         except Exception as e:
             print(f"[STT error] {e}")
             return None
 
+    def listen_vosk(self) -> Optional[str]:
+        # Decoded as the user speaks; the transcript is ready as soon as Vosk sees end of speech
+        with self._reading:
+            self.vosk.Reset()
+            while not self._stop.is_set():
+                if self.vosk.AcceptWaveform(self.source.stream.read(self.source.CHUNK)):
+                    text = json.loads(self.vosk.Result()).get("text", "")
+                    if text:
+                        return text
+            return None
+
 # -------------------- HELPERS --------------------
 
+def run_in_daemon(fn: Callable, *args) -> "asyncio.Future":
+    # Like asyncio.to_thread, but on a daemon thread instead of the default executor.
+    # asyncio.run() joins executor threads on shutdown, so a blocking input() or mic
+    # read there would keep Ctrl+C from exiting until it returned.
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+
+    def settle(result, exc):
+        if fut.done():
+            return
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+
+    def worker():
+        try:
+            result, exc = fn(*args), None
+        except BaseException as e:
+            result, exc = None, e
+        try:
+            loop.call_soon_threadsafe(settle, result, exc)
+        except RuntimeError:
+            pass  # loop already closed; we're exiting
+
+    threading.Thread(target=worker, daemon=True).start()
+    return fut
+
 def maybe_confirm(action_name: str, args: Dict[str, Any]) -> bool:
     if action_name in DESTRUCTIVE_ACTIONS:
         print(f"Jarvis wants to run a destructive action: {action_name} {args}")
@@ -379,74 +971,93 @@ def maybe_confirm(action_name: str, args: Dict[str, Any]) -> bool:
     return True
 
 def execute_action(action_name: str, args: Dict[str, Any]) -> str:
-    fn = TOOLBOX.get(action_name)
-    if not fn:
+    entry = TOOLBOX.get(action_name)
+    if not entry:
         return f"Unknown action '{action_name}'."
+    fn, adapt = entry
     try:
-        if action_name in {"press", "hotkey"}:
-            return fn(args.get("keys", []))
-        if action_name == "move_mouse":
-            return fn(int(args.get("x", 0)), int(args.get("y", 0)), float(args.get("duration", 0.2)))
-        if action_name == "click":
-            return fn(args.get("button", "left"), int(args.get("clicks", 1)))
-        if action_name == "scroll":
-            return fn(int(args.get("amount", 0)))
-        if action_name == "screenshot":
-            return fn(args.get("path", "./screenshot.png"))
-        if action_name == "write_clipboard":
-            return fn(args.get("text", ""))
         if action_name == "system_command":
             print(f"[system_command] {args.get('cmd')}")
             choice = input("This can be dangerous. Really run it? (y/N) ").strip().lower()
             if choice != "y":
                 return "Cancelled."
-            return fn(args.get("cmd", ""))
-        if action_name == "search_web":
-            return fn(args.get("query", ""), int(args.get("max_results", 5)))
-        if action_name == "open_app":
-            return fn(args.get("name", ""))
-        if action_name == "type_text":
-            return fn(args.get("text", ""))
-        if action_name == "read_clipboard":
-            return fn()
-        # fallback generic
-        return fn(**args)
+        return fn(*adapt(args))
     except Exception as e:
         return f"Tool execution failed: {e}"
 
+async def execute_actions_parallel(actions: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    # Keyboard/mouse/app actions keep their order in one worker; searches run alongside
+    serial = [i for i, (name, _) in enumerate(actions) if name not in PARALLEL_SAFE_ACTIONS]
+    parallel = [i for i, (name, _) in enumerate(actions) if name in PARALLEL_SAFE_ACTIONS]
+
+    def run_serial() -> List[str]:
+        return [execute_action(*actions[i]) for i in serial]
+
+    serial_out, *parallel_out = await asyncio.gather(
+        run_in_daemon(run_serial),
+        *(run_in_daemon(execute_action, *actions[i]) for i in parallel),
+    )
+    results = [""] * len(actions)
+    for i, out in zip(serial + parallel, serial_out + parallel_out):
+        results[i] = out
+    return results
+
+async def ask_llm(conv: Conversation, speaker: Optional[Speaker]) -> str:
+    # With a speaker, sentences are spoken while the rest of the reply streams in
+    stream = SpeechStream(speaker) if speaker else None
+    text = await call_llm(conv, stream.feed if stream else None)
+    if stream:
+        stream.flush()
+    return text
+
+def _init_langdetect_factory():
+    if detector_factory._factory is not None:
+        return
+    profiles = []
+    for lang in DETECT_LANGUAGES:
+        with open(os.path.join(detector_factory.PROFILES_DIRECTORY, lang), encoding="utf-8") as f:
+            profiles.append(f.read())
+    factory = detector_factory.DetectorFactory()
+    factory.load_json_profile(profiles)
+    detector_factory._factory = factory
+
+# langdetect.detect() calls init_factory() lazily; make it load our short list
+detector_factory.init_factory = _init_langdetect_factory
+
+@lru_cache(maxsize=512)
 def detect_language(text: str) -> str:
     try:
         return detect(text)
     except Exception:
         return "en"
 
-def strip_wake_word_if_present(text: str, wake_word: str) -> Optional[str]:
-    t = text.strip().lower()
-    ww = wake_word.lower()
-    if t.startswith(ww):
-        # remove the wake word and any separators after
-        return text[len(wake_word):].lstrip(" ,.-:").strip()
+def wake_variants(wake_word: str) -> Tuple[str, ...]:
+    # Built once per session; longest first so the fullest match is stripped
+    ww = wake_word.strip().lower() or WAKE_WORD
+    name = ww.split()[-1]
+    variants = {ww, name} | {f"{p} {name}" for p in WAKE_PREFIXES}
+    return tuple(sorted(variants, key=len, reverse=True))
+
+def strip_wake_word_if_present(text: str, wake_words: Tuple[str, ...]) -> Optional[str]:
+    t = text.strip()
+    low = t.lower()
+    for ww in wake_words:
+        # must be a whole word: "jarvisfoo" is not "jarvis"
+        if low.startswith(ww) and low[len(ww):len(ww) + 1] in ("", " ", ",", ".", "-", ":"):
+            # remove the wake word and any separators after
+            return t[len(ww):].lstrip(" ,.-:").strip()
     return None
 
 # -------------------- MAIN --------------------
 
-def main():
-    parser = argparse.ArgumentParser(description="Refined Jarvis (DeepSeek/OpenRouter)")
-    mode = parser.add_mutually_exclusive_group(required=True)
-    mode.add_argument("--voice", action="store_true", help="Voice mode (STT + TTS)")
-    mode.add_argument("--text", action="store_true", help="Text mode")
-
-    parser.add_argument("--wake", action="store_true", help="Require wake word 'hey jarvis' in voice mode")
-    parser.add_argument("--wake-word", default=WAKE_WORD, help="Custom wake word (default: 'hey jarvis')")
-
-    args = parser.parse_args()
-
+async def amain(args):
     voice_mode = args.voice
     wake_mode = args.wake
     wake_word = args.wake_word
+    wake_words = wake_variants(wake_word) if voice_mode and wake_mode else ()
 
-    if voice_mode and (sr is None or pyttsx3 is None):
-        print("Voice libs missing. Install: pip install SpeechRecognition pyaudio pyttsx3")
+    if voice_mode and sr is None:
+        print("Voice libs missing. Install: pip install SpeechRecognition pyaudio")
         return
 
     if pyautogui is None:
@@ -454,91 +1065,138 @@ def main():
         print("Install with: pip install pyautogui")
 
     speaker = Speaker() if voice_mode else None
-    listener = Listener() if voice_mode else None
+    listener = Listener(wake_engine=wake_mode, wake_word=wake_word) if voice_mode else None
+    local_wake = bool(listener and listener.porcupine and listener.source is not None)
 
     conv = Conversation()
     conv.add("system", SYSTEM_PROMPT)
 
     print("=== Jarvis ready ===")
     if voice_mode:
-        if wake_mode:
+        if local_wake:
+            print(f"Voice mode ON. Say '{listener.wake_keyword}' to talk to Jarvis (offline wake word).")
+        elif wake_mode:
             print(f"Voice mode ON. Say '{wake_word}' to talk to Jarvis.")
         else:
             print("Voice mode ON. Speak anytime.")
     else:
         print("Text mode ON. Type 'quit' to exit.")
 
-    while True:
-        if voice_mode:
-            heard = listener.listen_once()
-            if not heard:
-                continue
-
-            # Exit phrases
-            if heard.strip().lower() in {"quit", "exit", "stop"}:
-                print("Goodbye!")
-                if speaker:
-                    speaker.say("Goodbye!")
-                break
-
-            # Wake word handling
-            if wake_mode:
-                remainder = strip_wake_word_if_present(heard, wake_word)
-                if remainder is None or not remainder.strip():
-                    # Not addressed to Jarvis; ignore.
+    try:
+        while True:
+            if voice_mode:
+                # Don't listen while Jarvis is still talking
+                await run_in_daemon(speaker.wait)
+                if local_wake:
+                    # Only the command after the keyword goes to Google STT
+                    if not await run_in_daemon(listener.wait_for_wake_word):
+                        continue
+                heard = await run_in_daemon(listener.listen_once)
+                if not heard:
                     continue
-                user_text = remainder
+
+                # Exit phrases
+                if heard.strip().lower() in {"quit", "exit", "stop"}:
+                    print("Goodbye!")
+                    if speaker:
+                        speaker.say("Goodbye!")
+                        await run_in_daemon(speaker.wait)
+                    break
+
+                # Wake word handling (already done offline by Porcupine if available)
+                if wake_mode and not local_wake:
+                    remainder = strip_wake_word_if_present(heard, wake_words)
+                    if remainder is None or not remainder.strip():
+                        # Not addressed to Jarvis; ignore.
+                        continue
+                    user_text = remainder
+                else:
+                    user_text = heard
             else:
-                user_text = heard
-        else:
-            try:
-                user_text = input("You: ").strip()
-            except (EOFError, KeyboardInterrupt):
-                print("\nExiting...")
-                break
+                try:
+                    user_text = (await run_in_daemon(input, "You: ")).strip()
+                except EOFError:
+                    print("\nExiting...")
+                    break
 
-            if user_text.lower() in {"quit", "exit", "stop"}:
-                print("Goodbye!")
-                break
+                if user_text.lower() in {"quit", "exit", "stop"}:
+                    print("Goodbye!")
+                    break
 
-        conv.add("user", user_text)
+            conv.add("user", user_text)
 
-        try:
-            assistant_text = call_llm(conv)
-        except Exception as e:
-            print(f"[LLM error] {e}")
-            if voice_mode:
-                speaker.say("There was an error talking to the model.")
-            continue
-
-        action_name, action_args = try_parse_action(assistant_text)
-
-        if action_name:
-            print(f"Jarvis requested action: {action_name} {action_args}")
-            if maybe_confirm(action_name, action_args):
-                tool_output = execute_action(action_name, action_args)
-                print(f"[Tool Output]\n{tool_output}\n")
-                conv.add("assistant", assistant_text)  # keep the trace
-                conv.add("user", f"Tool result:\n{tool_output}")
-                try:
-                    final_answer = call_llm(conv)
-                except Exception as e:
-                    final_answer = f"(Model error after tool) {e}"
-                print(f"Jarvis: {final_answer}\n")
+            try:
+                assistant_text = await ask_llm(conv, speaker)
+            except Exception as e:
+                print(f"[LLM error] {e}")
                 if voice_mode:
-                    speaker.say(final_answer)
-                conv.add("assistant", final_answer)
+                    speaker.say("There was an error talking to the model.")
+                continue
+
+            actions = try_parse_actions(assistant_text)
+
+            if actions:
+                for action_name, action_args in actions:
+                    print(f"Jarvis requested action: {action_name} {action_args}")
+                allowed = [await run_in_daemon(maybe_confirm, name, args) for name, args in actions]
+                if any(allowed):
+                    outputs = iter(await execute_actions_parallel([a for a, ok in zip(actions, allowed) if ok]))
+                    results = [next(outputs) if ok else "Action denied." for ok in allowed]
+                    if len(actions) == 1:
+                        tool_output = results[0]
+                    else:
+                        tool_output = "\n".join(f"[{i}] {name}: {out}" for i, ((name, _), out) in enumerate(zip(actions, results), 1))
+                    print(f"[Tool Output]\n{tool_output}\n")
+                    conv.add("assistant", assistant_text)  # keep the trace
+                    conv.add("user", f"{TOOL_RESULT_PREFIX}{tool_output}")
+
+                    # Let the user hear something while the follow-up request is in flight
+                    if voice_mode:
+                        speaker.say("Working on it")
+                    try:
+                        final_answer = await ask_llm(conv, speaker)
+                    except Exception as e:
+                        final_answer = f"(Model error after tool) {e}"
+                        if voice_mode:
+                            speaker.say(final_answer)
+                    print(f"Jarvis: {final_answer}\n")
+                    conv.add("assistant", final_answer)
+                else:
+                    msg = "Action denied."
+                    print(msg)
+                    if voice_mode:
+                        speaker.say(msg)
+                    conv.add("assistant", msg)
             else:
-                msg = "Action denied."
-                print(msg)
-                if voice_mode:
-                    speaker.say(msg)
-                conv.add("assistant", msg)
-        else:
-            print(f"Jarvis: {assistant_text}\n")
-            if voice_mode:
-                speaker.say(assistant_text)
-            conv.add("assistant", assistant_text)
+                print(f"Jarvis: {assistant_text}\n")
+                conv.add("assistant", assistant_text)
+    finally:
+        if listener:
+            listener.close()
+        if isinstance(RESPONSE_CACHE, shelve.Shelf):
+            RESPONSE_CACHE.close()
+        await HTTP_CLIENT.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refined Jarvis (DeepSeek/OpenRouter)")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--voice", action="store_true", help="Voice mode (STT + TTS)")
+    mode.add_argument("--text", action="store_true", help="Text mode")
+
+    parser.add_argument("--wake", action="store_true", help="Require wake word 'hey jarvis' in voice mode")
+    parser.add_argument("--wake-word", default=WAKE_WORD, help="Custom wake word (default: 'hey jarvis')")
+
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(amain(args))
+    except KeyboardInterrupt:
+        print("\nExiting...")
+        # amain's finally has already cleaned up. A daemon reader may still be blocked in
+        # input() holding stdin's lock, which makes normal interpreter shutdown abort.
+        sys.stdout.flush()
+        os._exit(130)
 
 
 if __name__ == "__main__":
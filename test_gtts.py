@@ -1,21 +1,16 @@
-import os
-import uuid
-import tempfile
+import io
 from gtts import gTTS
-from playsound import playsound
+import sounddevice as sd
+import soundfile as sf
 
 text = "Hello! I am Jarvis. Testing my voice."
 
-# Create a unique temp path WITHOUT keeping the file open
-tmp_path = os.path.join(tempfile.gettempdir(), f"jarvis_{uuid.uuid4().hex}.mp3")
+# Keep the mp3 in memory: no temp file to create, lock or clean up
+buf = io.BytesIO()
+tts = gTTS(text=text, lang="en")
+tts.write_to_fp(buf)
+buf.seek(0)
 
-try:
-    tts = gTTS(text=text, lang="en")
-    tts.save(tmp_path)          # write after we closed everything
-    playsound(tmp_path)         # play it
-finally:
-    # Clean up (ignore errors if file is locked)
-    try:
-        os.remove(tmp_path)
-    except Exception:
-        pass
+data, rate = sf.read(buf)   # decode the mp3
+sd.play(data, rate)         # play it
+sd.wait()
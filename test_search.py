@@ -0,0 +1,11 @@
+from jarvis import _ddgs, tool_search_web
+
+# Searches should share one DuckDuckGo session unless a search fails
+session = _ddgs()
+print(tool_search_web("python asyncio", max_results=2))
+print(tool_search_web("duckduckgo search", max_results=2))
+
+if _ddgs() is session:
+    print("OK: both searches used one session")
+else:
+    print("A search failed, so the session was replaced")